@@ -4,7 +4,6 @@
 
 from enum import Enum
 
-import PyQt5
 from docutils import nodes
 from docutils.parsers.rst import directives
 from sphinx.ext.autosummary import Autosummary, get_documenter
@@ -13,6 +12,73 @@ from sphinx.util.inspect import safe_getattr
 # from sphinx.directives import directive
 
 
+# summary groups rendered by the directive, by option name:
+# (rubric title, autodoc objtype, include_public, signal, enum)
+SUMMARY_GROUPS = {
+    "methods": ("Methods", "method", ["__init__"], False, False),
+    "enums": ("Enums", "class", None, False, True),
+    "signals": ("Signals", "attribute", None, True, False),
+    "attributes": ("Attributes", "attribute", None, False, False),
+}
+
+
+def get_class_members(obj, typ, objtype_of, include_public=None, signal=False, enum=False):
+    """
+    Return the members of a class which would be documented as typ.
+
+    objtype_of is a callable returning the autodoc objtype of a member,
+    so that the classification can be used outside of a sphinx build.
+    """
+    # deferred, PyQt5 is only needed once classes are introspected
+    from PyQt5.QtCore import pyqtSignal
+
+    if not include_public:
+        include_public = []
+    items = []
+
+    for name in dir(obj):
+        if name not in obj.__dict__.keys():
+            continue
+        try:
+            chobj = safe_getattr(obj, name)
+            # cl = get_class_that_defined_method(chobj)
+            # print(name, chobj.__qualname__, type(chobj), issubclass(chobj, Enum), objtype_of(chobj))
+            if objtype_of(chobj) == typ:
+                if typ == "attribute":
+                    if signal and not isinstance(chobj, pyqtSignal):
+                        continue
+                    if not signal and isinstance(chobj, pyqtSignal):
+                        continue
+                    # skip monkey patched enums
+                    # the monkeypatched enums coming out of scoped enum inherit Enum
+                    # while the standard/old ones do not
+                    if hasattr(chobj, "__objclass__") and issubclass(chobj.__objclass__, Enum):
+                        continue
+                elif typ == "class":
+                    if enum:
+                        if not issubclass(chobj, Enum):
+                            continue
+                    if not enum and issubclass(chobj, Enum):
+                        continue
+                items.append(name)
+        except AttributeError:
+            continue
+    public = [x for x in items if x in include_public or not x.startswith("_")]
+    return public, items
+
+
+def get_summary_groups(obj, objtype_of):
+    """
+    Return the public members listed in each summary table of a class,
+    as a dict keyed by the SUMMARY_GROUPS option names.
+    """
+    groups = {}
+    for option, (_, typ, include_public, signal, enum) in SUMMARY_GROUPS.items():
+        _, items = get_class_members(obj, typ, objtype_of, include_public, signal, enum)
+        groups[option] = [x for x in items if not x.startswith("_")]
+    return groups
+
+
 class AutoAutoSummary(Autosummary):
     """
     Create a summary for methods, attributes and signals (autosummary).
@@ -37,42 +103,15 @@ class AutoAutoSummary(Autosummary):
     @staticmethod
     def get_members(doc, obj, typ, include_public=None, signal=False, enum=False):
         try:
-            if not include_public:
-                include_public = []
-            items = []
-
-            for name in dir(obj):
-                if name not in obj.__dict__.keys():
-                    continue
-                try:
-                    chobj = safe_getattr(obj, name)
-                    documenter = get_documenter(doc.settings.env.app, chobj, obj)
-                    # cl = get_class_that_defined_method(chobj)
-                    # print(name, chobj.__qualname__, type(chobj), issubclass(chobj, Enum), documenter.objtype)
-                    if documenter.objtype == typ:
-                        if typ == "attribute":
-                            if signal and isinstance(chobj, PyQt5.QtCore.pyqtSignal):
-                                continue
-                            if not signal and isinstance(chobj, PyQt5.QtCore.pyqtSignal):
-                                continue
-                            # skip monkey patched enums
-                            # the monkeypatched enums coming out of scoped enum inherit Enum
-                            # while the standard/old ones do not
-                            if hasattr(chobj, "__objclass__") and issubclass(
-                                chobj.__objclass__, Enum
-                            ):
-                                continue
-                        elif typ == "class":
-                            if enum:
-                                if not issubclass(chobj, Enum):
-                                    continue
-                            if not enum and issubclass(chobj, Enum):
-                                continue
-                        items.append(name)
-                except AttributeError:
-                    continue
-            public = [x for x in items if x in include_public or not x.startswith("_")]
-            return public, items
+            app = doc.settings.env.app
+            return get_class_members(
+                obj,
+                typ,
+                lambda chobj: get_documenter(app, chobj, obj).objtype,
+                include_public,
+                signal,
+                enum,
+            )
         except BaseException as e:
             print(str(e))
             raise e
@@ -86,22 +125,13 @@ class AutoAutoSummary(Autosummary):
             (module_name, class_name) = clazz.rsplit(".", 1)
             m = __import__(module_name, globals(), locals(), [class_name])
             c = getattr(m, class_name)
-            if "methods" in self.options:
-                rubric_title = "Methods"
-                _, rubric_elems = self.get_members(self.state.document, c, "method", ["__init__"])
-            elif "enums" in self.options:
-                rubric_title = "Enums"
-                _, rubric_elems = self.get_members(
-                    self.state.document, c, "class", None, False, True
-                )
-            elif "signals" in self.options:
-                rubric_title = "Signals"
-                _, rubric_elems = self.get_members(self.state.document, c, "attribute", None, True)
-            elif "attributes" in self.options:
-                rubric_title = "Attributes"
-                _, rubric_elems = self.get_members(
-                    self.state.document, c, "attribute", None, False
-                )
+            for option, (title, typ, include_public, signal, enum) in SUMMARY_GROUPS.items():
+                if option in self.options:
+                    rubric_title = title
+                    _, rubric_elems = self.get_members(
+                        self.state.document, c, typ, include_public, signal, enum
+                    )
+                    break
 
             if rubric_elems:
                 rubric_public_elems = list(filter(lambda e: not e.startswith("_"), rubric_elems))
@@ -1,16 +1,17 @@
 import os
 import sys
 
-import sphinx_rtd_theme
-import yaml
-
 # If extensions (or modules to document with autodoc) are in another directory,
 # add these directories to sys.path here. If the directory is relative to the
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 sys.path.insert(0, os.path.abspath("../../"))
 
-with open("../../pyqgis_conf.yml") as f:
-    cfg = yaml.safe_load(f)
+# Keep this file cheap to execute. It runs in the main sphinx process, and the
+# processes forked by parallel builds inherit what it loaded: configuration
+# and class maps are read from the JSON cache, without importing PyYAML.
+from config_cache import load_yaml  # noqa: E402
+
+cfg = load_yaml(os.path.abspath("../../pyqgis_conf.yml"))
 
 
 # -- General configuration -----------------------------------------------------
@@ -73,8 +74,8 @@ pygments_style = "sphinx"
 
 # The theme to use for HTML and HTML Help pages.  See the documentation for
 # a list of builtin themes.
+# the theme is found through its entry point, importing it here is not needed
 html_theme = "sphinx_rtd_theme"
-html_theme_path = [sphinx_rtd_theme.get_html_theme_path()]  # use with module import
 
 # html_theme_path = ['.']  # use with git submodule
 
@@ -214,10 +215,12 @@ man_pages = [("index", "qgiswebsite", "QGIS Website Documentation", ["QGIS Contr
 locale_dirs = ["../i18n/"]
 gettext_compact = False
 
-class_maps = {}
-for module in ("3d", "analysis", "core", "gui", "server"):
-    with open(f"/usr/lib/python3/dist-packages/qgis/{module}/class_map.yaml") as f:
-        class_maps[module] = yaml.safe_load(f)
+# loaded here rather than on first use, so that the processes forked by
+# parallel builds inherit them instead of each loading them again
+class_maps = {
+    module: load_yaml(f"/usr/lib/python3/dist-packages/qgis/{module}/class_map.yaml")
+    for module in ("3d", "analysis", "core", "gui", "server")
+}
 
 
 def linkcode_resolve(domain, info):
@@ -0,0 +1,51 @@
+# Loads the YAML configuration files (pyqgis_conf.yml, QGIS class maps) once,
+# and keeps a JSON copy of them so that the Sphinx process and its workers
+# neither have to import PyYAML nor parse YAML again.
+#
+# Caches are precomputed by running this module on the files before the build:
+# python3 config_cache.py pyqgis_conf.yml /usr/lib/python3/dist-packages/qgis/core/class_map.yaml
+
+import json
+import os
+import sys
+from functools import cache
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+
+def cache_path(path):
+    key = os.path.abspath(path).strip(os.sep).replace(os.sep, "_")
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+@cache
+def load_yaml(path):
+    """Return the content of a YAML file, using the JSON cache when up to date."""
+    stat = os.stat(path)
+    source = [stat.st_mtime_ns, stat.st_size]
+    cached = cache_path(path)
+    try:
+        with open(cached) as f:
+            data = json.load(f)
+        if data["source"] == source:
+            return data["content"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    import yaml
+
+    with open(path) as f:
+        content = yaml.safe_load(f)
+
+    # write atomically, several sphinx workers might refresh the cache
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = f"{cached}.{os.getpid()}"
+    with open(tmp, "w") as f:
+        json.dump({"source": source, "content": content}, f)
+    os.replace(tmp, cached)
+    return content
+
+
+if __name__ == "__main__":
+    for path in sys.argv[1:]:
+        load_yaml(path)
@@ -8,10 +8,7 @@
 import enum
 import re
 
-import yaml
-
-with open("pyqgis_conf.yml") as f:
-    cfg = yaml.safe_load(f)
+from config_cache import load_yaml
 
 
 # https://github.com/sphinx-doc/sphinx/blob/685e3fdb49c42b464e09ec955e1033e2a8729fff/sphinx/ext/autodoc/__init__.py#L51
@@ -73,7 +70,7 @@ def process_docstring(app, what, name, obj, options, lines):
             match = py_ext_sig_re.match(signature)
             if not match:
                 print(obj)
-                if name not in cfg["non-instantiable"]:
+                if name not in load_yaml("pyqgis_conf.yml")["non-instantiable"]:
                     raise Warning(f"invalid signature for {name}: {signature}")
             else:
                 exmod, path, base, args, retann, signal = match.groups()
@@ -125,11 +122,21 @@ def process_signature(app, what, name, obj, options, signature, return_annotatio
     return signature, return_annotation
 
 
-def skip_member(app, what, name, obj, skip, options):
-    # skip monkey patched enums (base classes are different)
+def is_skipped_member(name, obj):
+    """Return whether a class member is left out of the docs.
+
+    This is shared by the autodoc-skip-member hook and the scripts which
+    introspect the classes, so that they all document the same members.
+    """
     if name == "staticMetaObject":
         return True
-    if hasattr(obj, "is_monkey_patched") and obj.is_monkey_patched:
-        print(f"skipping monkey patched enum {name}")
+    # skip monkey patched enums (base classes are different)
+    return hasattr(obj, "is_monkey_patched") and obj.is_monkey_patched
+
+
+def skip_member(app, what, name, obj, skip, options):
+    if is_skipped_member(name, obj):
+        if name != "staticMetaObject":
+            print(f"skipping monkey patched enum {name}")
         return True
     return skip
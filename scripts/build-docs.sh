@@ -72,6 +72,9 @@ for module in "3d" "analysis" "core" "gui" "server"; do
     wget -O /usr/lib/python3/dist-packages/qgis/${module}/class_map.yaml https://raw.githubusercontent.com/qgis/QGIS/${RELEASE_TAG}/python/${module}/class_map.yaml
 done
 
+# precompute the JSON caches of the configuration files read by conf.py
+python3 config_cache.py pyqgis_conf.yml /usr/lib/python3/dist-packages/qgis/{3d,analysis,core,gui,server}/class_map.yaml
+
 if [[ -n ${QGIS_BUILD_DIR} ]]; then
   export PYTHONPATH=${PYTHONPATH}:$QGIS_BUILD_DIR/output/python
   #export PATH=$PATH:/usr/local/bin/:$QGIS_BUILD_DIR/build/output/bin
@@ -89,8 +92,14 @@ cp -r _templates api/${QGIS_VERSION}/_templates
 cp -r _static api/${QGIS_VERSION}/_static
 echo "##[endgroup]"
 
-echo "##[group]Build HTML"
+echo "##[group]Import time of the configuration"
 ${GP}sed -r "s/__QGIS_VERSION__/${QGIS_VERSION}/g;" conf.in.py > api/${QGIS_VERSION}/conf.py
+pushd api/${QGIS_VERSION}
+python3 ${DIR}/import_time_report.py -- -c "import runpy; runpy.run_path('conf.py'); import autoautosummary, process_links"
+popd
+echo "##[endgroup]"
+
+echo "##[group]Build HTML"
 sphinx-build -M html api/${QGIS_VERSION} build/${QGIS_VERSION} -T -j auto
 echo "##[endgroup]"
 
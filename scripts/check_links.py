@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+
+# Validates the class references produced by process_links without building
+# the docs: an inventory of the documented objects is built by introspection
+# (or read from a built objects.inv) and the references found in the processed
+# docstrings and in the generated RST are resolved against it, the way the
+# Sphinx python domain does.
+
+import argparse
+import importlib
+import inspect
+import os
+import re
+import sys
+import zlib
+from collections import defaultdict
+
+from config_cache import load_yaml
+from process_links import create_links, is_skipped_member, show_inheritance
+
+PACKAGES = ["core", "gui", "server", "analysis", "processing", "_3d"]
+
+# :py:class:`target` and :class:`target` roles
+class_role_re = re.compile(r":(?:py:)?class:`([^`]+)`")
+# only references to QGIS objects are checked
+qgis_target_re = re.compile(r"^(qgis\.|Qgi?s)")
+# member pages of split classes, see make_api_rst.split_class_members
+member_page_re = re.compile(r"^(.+?)_(methods|enums|signals|attributes)$")
+package_comment_re = re.compile(r"^\.\. package: qgis\\\.(\w+)")
+
+
+def introspected_inventory(packages, skipped):
+    """Return the fully qualified names of the classes documented in the packages.
+
+    Classes are listed the same way make_api_rst does. Nested classes are
+    included, except those left out by the autodoc-skip-member hook (e.g.
+    monkey patched enums), so that the inventory matches the built docs.
+    """
+    inventory = set()
+
+    def add_class(name, clazz, depth=0):
+        inventory.add(name)
+        if depth > 2:
+            return
+        for member_name, member in vars(clazz).items():
+            if (
+                inspect.isclass(member)
+                and not member_name.startswith("_")
+                and not is_skipped_member(member_name, member)
+            ):
+                add_class(f"{name}.{member_name}", member, depth + 1)
+
+    for package_name, package in packages.items():
+        for class_name in dir(package):
+            if class_name.startswith("_") or class_name in skipped:
+                continue
+            obj = getattr(package, class_name)
+            if inspect.isclass(obj):
+                add_class(f"qgis.{package_name}.{class_name}", obj)
+    return inventory
+
+
+def objects_inv_inventory(path):
+    """Return the names of the python classes listed in a sphinx objects.inv file."""
+    inventory = set()
+    with open(path, "rb") as f:
+        # 4 lines of plain text header, followed by the compressed entries
+        for _ in range(4):
+            f.readline()
+        content = zlib.decompress(f.read()).decode()
+    for line in content.splitlines():
+        # name domain:role priority uri dispname, the name may contain spaces
+        match = re.match(r"(.+?)\s+(\S+:\S+)\s+(-?\d+)\s+(\S*)\s+(.*)", line)
+        if match and match.group(2) in ("py:class", "py:exception"):
+            inventory.add(match.group(1))
+    return inventory
+
+
+def resolve(target, module, class_name, inventory, suffixes):
+    """Return whether a class reference can be resolved.
+
+    :param target: The role target, e.g. .QgsVectorLayer or ~qgis.core.QgsFeature.
+    :type target: str
+
+    :param module: The current module, e.g. qgis.core.
+    :type module: str
+
+    :param class_name: The current class, e.g. QgsVectorLayer.
+    :type class_name: str
+    """
+    target = target.lstrip("~!")
+    if target.startswith("."):
+        target = target[1:]
+        candidates = [f"{module}.{class_name}.{target}", f"{module}.{target}", target]
+        if any(candidate in inventory for candidate in candidates):
+            return True
+        return target in suffixes
+    return any(
+        candidate in inventory
+        for candidate in (f"{module}.{class_name}.{target}", f"{module}.{target}", target)
+    )
+
+
+def find_references(lines):
+    for line in lines:
+        for target in class_role_re.findall(line):
+            if qgis_target_re.match(target.lstrip("~!.")):
+                yield target
+
+
+def docstring_references(class_name, clazz):
+    """Yield (member, target) for the references of the processed docstrings of a class."""
+    bases = show_inheritance(clazz)
+    lines = [bases] if bases else []
+    lines += (clazz.__doc__ or "").splitlines()
+    for target in find_references(create_links(line) for line in lines):
+        yield class_name, target
+
+    for member_name, member in vars(clazz).items():
+        if member_name.startswith("__") and member_name != "__init__":
+            continue
+        doc = getattr(member, "__doc__", None)
+        if not isinstance(doc, str) or doc is getattr(type(member), "__doc__", None):
+            continue
+        for target in find_references(create_links(line) for line in doc.splitlines()):
+            yield f"{class_name}.{member_name}", target
+
+
+def rst_references(rst_dir):
+    """Yield (module, class, file, target) for the references of the generated RST files."""
+    for dirpath, dirnames, filenames in os.walk(rst_dir):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if not filename.endswith(".rst"):
+                continue
+            path = os.path.join(dirpath, filename)
+            with open(path) as f:
+                lines = f.read().splitlines()
+            module = "qgis"
+            for line in lines[:5]:
+                match = package_comment_re.match(line)
+                if match:
+                    module = f"qgis.{match.group(1)}"
+            stem = filename[: -len(".rst")]
+            match = member_page_re.match(stem)
+            class_name = match.group(1) if match else stem
+            for target in find_references(lines):
+                yield module, class_name, os.path.relpath(path, rst_dir), target
+
+
+def check_links(packages, inventory, skipped, rst_dir=None):
+    """Return the unresolved references, grouped by class.
+
+    :returns: A dict of qualified class name => list of (location, target).
+    :rtype: dict
+    """
+    suffixes = set()
+    for name in inventory:
+        parts = name.split(".")
+        for i in range(1, len(parts)):
+            suffixes.add(".".join(parts[i:]))
+
+    unresolved = defaultdict(list)
+    for package_name, package in packages.items():
+        module = f"qgis.{package_name}"
+        for class_name in dir(package):
+            if class_name.startswith("_") or class_name in skipped:
+                continue
+            clazz = getattr(package, class_name)
+            if not inspect.isclass(clazz):
+                continue
+            for location, target in docstring_references(class_name, clazz):
+                if not resolve(target, module, class_name, inventory, suffixes):
+                    unresolved[f"{module}.{class_name}"].append((location, target))
+
+    if rst_dir:
+        for module, class_name, location, target in rst_references(rst_dir):
+            if not resolve(target, module, class_name, inventory, suffixes):
+                unresolved[f"{module}.{class_name}"].append((location, target))
+
+    return unresolved
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Report the class references of the PyQGIS docs which cannot be resolved"
+    )
+    parser.add_argument(
+        "--package",
+        "-p",
+        dest="package_limit",
+        default=PACKAGES,
+        nargs="+",
+        choices=PACKAGES,
+        help="limit the check to some packages",
+    )
+    parser.add_argument(
+        "--rst",
+        "-r",
+        dest="rst_dir",
+        default=None,
+        help="also check the generated RST, e.g. api/master",
+    )
+    parser.add_argument(
+        "--inventory",
+        "-i",
+        dest="objects_inv",
+        default=None,
+        help="resolve against a built objects.inv instead of introspection",
+    )
+    args = parser.parse_args()
+
+    cfg = load_yaml("pyqgis_conf.yml")
+    if args.objects_inv:
+        inventory = objects_inv_inventory(args.objects_inv)
+    else:
+        # always resolve against all the packages, references cross them
+        inventory = introspected_inventory(
+            {pkg: importlib.import_module(f"qgis.{pkg}") for pkg in PACKAGES}, cfg["skipped"]
+        )
+    packages = {pkg: importlib.import_module(f"qgis.{pkg}") for pkg in args.package_limit}
+
+    unresolved = check_links(packages, inventory, cfg["skipped"], args.rst_dir)
+    for class_name in sorted(unresolved):
+        print(class_name)
+        for location, target in sorted(set(unresolved[class_name])):
+            print(f"  {location}: {target}")
+
+    count = sum(len(set(references)) for references in unresolved.values())
+    print(f"{count} unresolved references in {len(unresolved)} classes")
+    sys.exit(1 if unresolved else 0)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+
+
+def parse_importtime(lines):
+    """Parse the output of python -X importtime.
+
+    :param lines: The stderr lines of the interpreter.
+    :type lines: list
+
+    :returns: A list of (module, self time, cumulative time, depth), times in microseconds.
+    :rtype: list
+    """
+    imports = []
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # header line
+            continue
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        depth = (len(name) - len(module) - 1) // 2
+        imports.append((module, int(fields[0]), int(fields[1]), depth))
+    return imports
+
+
+def summarize(imports, top=15):
+    """Return a short text report of the import times.
+
+    It gives the total, the slowest top level imports (including what they
+    import) and the packages which take the most time by themselves.
+    """
+    total = sum(cumulative for _, _, cumulative, depth in imports if depth == 0)
+    by_package = defaultdict(int)
+    for module, self_time, _, _ in imports:
+        by_package[module.split(".")[0]] += self_time
+
+    report = [f"{len(imports)} modules imported in {total / 1000:.1f} ms", ""]
+    report.append("slowest imports (cumulative):")
+    top_level = sorted(
+        (item for item in imports if item[3] == 0), key=lambda item: item[2], reverse=True
+    )
+    for module, _, cumulative, _ in top_level[:top]:
+        report.append(f"  {cumulative / 1000:8.1f} ms  {module}")
+    report.append("")
+    report.append("time spent per package (self):")
+    for package, self_time in sorted(by_package.items(), key=lambda x: x[1], reverse=True)[:top]:
+        report.append(f"  {self_time / 1000:8.1f} ms  {package}")
+    return "\n".join(report)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Summarize the import time of a python command (python -X importtime)"
+    )
+    parser.add_argument("--top", "-t", dest="top", type=int, default=15)
+    parser.add_argument(
+        "command", nargs=argparse.REMAINDER, help="python arguments, e.g. -c 'import conf'"
+    )
+    args = parser.parse_args()
+    command = args.command[1:] if args.command[:1] == ["--"] else args.command
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *command], stderr=subprocess.PIPE, text=True
+    )
+    imports = parse_importtime(process.stderr.splitlines())
+    # keep the errors of the command itself
+    errors = [line for line in process.stderr.splitlines() if not line.startswith("import time:")]
+    if errors:
+        print("\n".join(errors), file=sys.stderr)
+    print(summarize(imports, args.top))
+    sys.exit(process.returncode)
@@ -1,14 +1,20 @@
 #!/usr/bin/env python3
 
 import argparse
+import json
 from os import makedirs
 from shutil import rmtree
 from string import Template
 
-import yaml
+from autoautosummary import SUMMARY_GROUPS, get_summary_groups
+from config_cache import load_yaml
+from process_links import is_skipped_member
+from sphinx.ext.autosummary import get_documenter
+from sphinx.ext.autosummary.generate import DummyApplication, setup_documenters
+from sphinx.locale import get_translator
+from sphinx.util.inspect import safe_getattr
 
-with open("pyqgis_conf.yml") as f:
-    cfg = yaml.safe_load(f)
+cfg = load_yaml("pyqgis_conf.yml")
 
 
 parser = argparse.ArgumentParser(description="Create RST files for QGIS Python API Documentation")
@@ -30,6 +36,14 @@ parser.add_argument(
     nargs="+",
     help="limit the build of the docs to a single class",
 )
+parser.add_argument(
+    "--split-threshold",
+    "-s",
+    dest="split_threshold",
+    type=int,
+    default=cfg.get("split_member_threshold", 0),
+    help="split classes with more members than this into several pages (0 to disable)",
+)
 args = parser.parse_args()
 
 if args.package_limit:
@@ -142,6 +156,23 @@ PACKAGENAME
 """
 
 
+member_header = """
+.. package: qgis\\.PACKAGENAME
+
+TITLE
+...............................................
+
+"""
+
+# autodoc directive used to document a member of each summary group
+member_directives = {
+    "methods": ".. automethod:: {}",
+    "enums": ".. autoclass:: {}\n   :members:\n   :undoc-members:",
+    "signals": ".. autoattribute:: {}",
+    "attributes": ".. autoattribute:: {}",
+}
+
+
 def generate_docs():
     """Generate RST documentation by introspection of QGIS libs.
 
@@ -170,6 +201,8 @@ def generate_docs():
     with open("rst/qgis_pydoc_template.txt") as template_file:
         template_text = template_file.read()
     template = Template(template_text)
+    with open("rst/qgis_pydoc_overview_template.txt") as template_file:
+        overview_template = Template(template_file.read())
 
     # Iterate over every class in every package and write out an rst
     # template based on standard rst template
@@ -185,7 +218,29 @@ def generate_docs():
         for class_name in extract_package_classes(package):
             print(class_name)
             substitutions = {"PACKAGE": package_name, "CLASS": class_name}
-            class_template = template.substitute(**substitutions)
+            member_pages = split_class_members(getattr(package, class_name), class_name)
+            if member_pages:
+                class_template = overview_template.substitute(
+                    **substitutions,
+                    MEMBER_PAGES=json.dumps(
+                        {page: members for page, (_, _, members) in member_pages.items()}
+                    ),
+                    TOCTREE="\n".join(f"   {page}" for page in member_pages),
+                    EXCLUDED_MEMBERS=", ".join(
+                        member for _, _, members in member_pages.values() for member in members
+                    ),
+                )
+                for page, (title, option, members) in member_pages.items():
+                    write_member_page(
+                        f"api/{qgis_version}/{package_name}/{page}.rst",
+                        package_name,
+                        class_name,
+                        title,
+                        option,
+                        members,
+                    )
+            else:
+                class_template = template.substitute(**substitutions)
             class_rst = open(f"api/{qgis_version}/{package_name}/{class_name}.rst", "w")
             print(class_template, file=class_rst)
             class_rst.close()
@@ -196,6 +251,80 @@ def generate_docs():
     index.close()
 
 
+# sphinx application stand-in holding the autodoc documenters
+documenters_app = None
+
+
+def member_objtype(parent):
+    """Return a function giving the autodoc objtype of members of parent.
+
+    This uses the same documenters as a sphinx build, so that classes are
+    split using the same member classification as AutoAutoSummary.
+    """
+    global documenters_app
+    if documenters_app is None:
+        documenters_app = DummyApplication(get_translator())
+        setup_documenters(documenters_app)
+    return lambda member: get_documenter(documenters_app, member, parent).objtype
+
+
+def split_class_members(clazz, class_name):
+    """Split the members of a class into one page per summary group if it is too large.
+
+    :param clazz: The class to split.
+    :type clazz: type
+
+    :param class_name: The name of the class.
+    :type class_name: str
+
+    :returns: An ordered dict of page name => (title, summary group, members),
+        empty if the class does not need to be split.
+    :rtype: dict
+    """
+    threshold = args.split_threshold
+    if threshold <= 0 or not isinstance(clazz, type):
+        return {}
+
+    groups = get_summary_groups(clazz, member_objtype(clazz))
+    # leave out the members hidden by the autodoc-skip-member hook, member
+    # pages use explicit directives which do not go through it
+    groups = {
+        option: [
+            member
+            for member in members
+            if not is_skipped_member(member, safe_getattr(clazz, member, None))
+        ]
+        for option, members in groups.items()
+    }
+    if len(set().union(*groups.values())) <= threshold:
+        return {}
+
+    # one page per summary group, so that their URLs do not change when
+    # members are added or removed
+    return {
+        f"{class_name}_{option}": (f"{class_name}: {SUMMARY_GROUPS[option][0]}", option, members)
+        for option, members in groups.items()
+        if members
+    }
+
+
+def write_member_page(path, package_name, class_name, title, option, members):
+    """Write an RST page documenting some members of a split class.
+
+    Members keep their fully qualified targets, so cross references resolve
+    as if they were documented on the class page.
+    """
+    with open(path, "w") as member_rst:
+        member_rst.write(
+            member_header.replace("PACKAGENAME", package_name).replace("TITLE", title)
+        )
+        for member in members:
+            member_rst.write(
+                member_directives[option].format(f"qgis.{package_name}.{class_name}.{member}")
+            )
+            member_rst.write("\n\n")
+
+
 def extract_package_classes(package):
     """Extract the classes from the package provided.
 
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import struct
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Every entry gets the same timestamp (1980-01-01 00:00, the earliest DOS date)
+# and permissions, so that identical trees give byte-identical archives.
+DOS_TIME = 0
+DOS_DATE = (1 << 5) | 1
+FILE_ATTRIBUTES = 0o100644 << 16
+DIR_ATTRIBUTES = (0o040755 << 16) | 0x10
+VERSION_MADE_BY = (3 << 8) | 45  # unix, zip 4.5
+VERSION_NEEDED = 20
+VERSION_NEEDED_ZIP64 = 45
+UTF8_FLAG = 0x800
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP_COUNT_LIMIT = 0xFFFF
+
+LOCAL_HEADER = struct.Struct("<4sHHHHHIIIHH")
+CENTRAL_HEADER = struct.Struct("<4sHHHHHHIIIHHHHHII")
+ZIP64_EXTRA = struct.Struct("<HHQ")
+ZIP64_END = struct.Struct("<4sQHHIIQQQQ")
+ZIP64_LOCATOR = struct.Struct("<4sIQI")
+END_RECORD = struct.Struct("<4sHHHHIIH")
+
+
+def archive_comment(level):
+    """Comment identifying archives made by this script.
+
+    Compressed data from a previous archive is only reused if it was made
+    with the same settings, so that incremental and full packaging give
+    the same bytes.
+    """
+    return f"pyqgis-docs deflate level {level}".encode()
+
+
+class PreviousArchive:
+    """Read access to the raw compressed entries of a previous archive."""
+
+    def __init__(self, path, level):
+        self.entries = {}
+        self.file = None
+        if not path:
+            return
+        if not os.path.exists(path):
+            print(f"previous archive {path} not found, compressing everything")
+            return
+        with zipfile.ZipFile(path) as archive:
+            if archive.comment != archive_comment(level):
+                print(f"previous archive {path} was made with other settings, ignoring it")
+                return
+            self.entries = {info.filename: info for info in archive.infolist()}
+        self.file = open(path, "rb")
+
+    def matches(self, name, crc, size):
+        """Return whether the entry name has the given content in the previous archive."""
+        info = self.entries.get(name)
+        return info is not None and info.CRC == crc and info.file_size == size
+
+    def read_raw(self, name):
+        """Return the compression method and the raw compressed bytes of an entry."""
+        info = self.entries[name]
+        self.file.seek(info.header_offset)
+        header = LOCAL_HEADER.unpack(self.file.read(LOCAL_HEADER.size))
+        self.file.seek(header[9] + header[10], os.SEEK_CUR)
+        return info.compress_type, self.file.read(info.compress_size)
+
+    def close(self):
+        if self.file:
+            self.file.close()
+
+
+def walk_tree(source_dir):
+    """Yield (archive name, path) for a directory tree, in sorted order.
+
+    Directory names end with a slash and have no path.
+    """
+    root = os.path.basename(os.path.normpath(source_dir))
+    for dirpath, dirnames, filenames in os.walk(source_dir):
+        dirnames.sort()
+        relative = os.path.relpath(dirpath, source_dir)
+        prefix = root if relative == "." else f"{root}/{relative.replace(os.sep, '/')}"
+        yield f"{prefix}/", None
+        for filename in sorted(filenames):
+            yield f"{prefix}/{filename}", os.path.join(dirpath, filename)
+
+
+def compress_file(name, path, level, previous):
+    """Read and compress a file.
+
+    :returns: The CRC, the size, the compression method and the compressed
+        data, which is None when the previous archive has the same content.
+    :rtype: tuple
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    crc = zlib.crc32(data)
+    if previous.matches(name, crc, len(data)):
+        return crc, len(data), None, None
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    if len(compressed) >= len(data):
+        return crc, len(data), zipfile.ZIP_STORED, data
+    return crc, len(data), zipfile.ZIP_DEFLATED, compressed
+
+
+class ArchiveWriter:
+    """Minimal streaming zip writer, taking already compressed data."""
+
+    def __init__(self, output):
+        self.output = output
+        self.offset = 0
+        self.central_directory = []
+
+    def write(self, data):
+        self.output.write(data)
+        self.offset += len(data)
+
+    def add_entry(self, name, crc, size, method, data, is_dir=False):
+        encoded_name = name.encode()
+        flags = 0 if name.isascii() else UTF8_FLAG
+        if size > ZIP64_LIMIT or len(data) > ZIP64_LIMIT:
+            raise ValueError(f"{name} is too large to be archived")
+        self.central_directory.append(
+            (encoded_name, flags, method, crc, len(data), size, self.offset, is_dir)
+        )
+        self.write(
+            LOCAL_HEADER.pack(
+                b"PK\003\004",
+                VERSION_NEEDED,
+                flags,
+                method,
+                DOS_TIME,
+                DOS_DATE,
+                crc,
+                len(data),
+                size,
+                len(encoded_name),
+                0,
+            )
+        )
+        self.write(encoded_name)
+        self.write(data)
+
+    def close(self, comment):
+        central_directory_offset = self.offset
+        for name, flags, method, crc, csize, size, offset, is_dir in self.central_directory:
+            extra = b""
+            version_needed = VERSION_NEEDED
+            if offset >= ZIP64_LIMIT:
+                extra = ZIP64_EXTRA.pack(1, 8, offset)
+                offset = ZIP64_LIMIT
+                version_needed = VERSION_NEEDED_ZIP64
+            self.write(
+                CENTRAL_HEADER.pack(
+                    b"PK\001\002",
+                    VERSION_MADE_BY,
+                    version_needed,
+                    flags,
+                    method,
+                    DOS_TIME,
+                    DOS_DATE,
+                    crc,
+                    csize,
+                    size,
+                    len(name),
+                    len(extra),
+                    0,
+                    0,
+                    0,
+                    DIR_ATTRIBUTES if is_dir else FILE_ATTRIBUTES,
+                    offset,
+                )
+            )
+            self.write(name)
+            self.write(extra)
+        central_directory_size = self.offset - central_directory_offset
+        count = len(self.central_directory)
+
+        if (
+            count >= ZIP_COUNT_LIMIT
+            or central_directory_offset >= ZIP64_LIMIT
+            or central_directory_size >= ZIP64_LIMIT
+        ):
+            zip64_end_offset = self.offset
+            self.write(
+                ZIP64_END.pack(
+                    b"PK\006\006",
+                    ZIP64_END.size - 12,
+                    VERSION_MADE_BY,
+                    VERSION_NEEDED_ZIP64,
+                    0,
+                    0,
+                    count,
+                    count,
+                    central_directory_size,
+                    central_directory_offset,
+                )
+            )
+            self.write(ZIP64_LOCATOR.pack(b"PK\006\007", 0, zip64_end_offset, 1))
+
+        self.write(
+            END_RECORD.pack(
+                b"PK\005\006",
+                0,
+                0,
+                min(count, ZIP_COUNT_LIMIT),
+                min(count, ZIP_COUNT_LIMIT),
+                min(central_directory_size, ZIP64_LIMIT),
+                min(central_directory_offset, ZIP64_LIMIT),
+                len(comment),
+            )
+        )
+        self.write(comment)
+
+
+def make_archive(source_dir, output_path, previous_path=None, level=6, jobs=None):
+    """Package a directory tree into a reproducible zip archive.
+
+    Entries are sorted and get fixed timestamps and permissions. Files are
+    compressed in parallel while the archive is streamed to disk in order,
+    with a bounded number of files in flight. Compressed data of files
+    which did not change since the previous archive is copied as is.
+
+    :param source_dir: The directory to package, e.g. ./build.
+    :type source_dir: str
+
+    :param output_path: The archive to create.
+    :type output_path: str
+
+    :param previous_path: An archive previously created by this function.
+    :type previous_path: str
+
+    :param level: The deflate compression level.
+    :type level: int
+
+    :param jobs: The number of files compressed in parallel.
+    :type jobs: int
+    """
+    jobs = jobs or os.cpu_count() or 1
+    previous = PreviousArchive(previous_path, level)
+    reused = 0
+    tmp_path = f"{output_path}.tmp"
+
+    def write_entry(name, future):
+        nonlocal reused
+        if future is None:
+            writer.add_entry(name, 0, 0, zipfile.ZIP_STORED, b"", is_dir=True)
+            return
+        crc, size, method, data = future.result()
+        if data is None:
+            method, data = previous.read_raw(name)
+            reused += 1
+        writer.add_entry(name, crc, size, method, data)
+
+    try:
+        with open(tmp_path, "wb") as output, ThreadPoolExecutor(jobs) as executor:
+            writer = ArchiveWriter(output)
+            pending = deque()
+            for name, path in walk_tree(source_dir):
+                future = None
+                if path is not None:
+                    future = executor.submit(compress_file, name, path, level, previous)
+                pending.append((name, future))
+                if len(pending) >= jobs * 4:
+                    write_entry(*pending.popleft())
+            while pending:
+                write_entry(*pending.popleft())
+            writer.close(archive_comment(level))
+        os.replace(tmp_path, output_path)
+    finally:
+        previous.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    print(
+        f"{output_path}: {len(writer.central_directory)} entries, "
+        f"{reused} reused from previous archive"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Create a reproducible zip archive of the built documentation"
+    )
+    parser.add_argument("source_dir", help="directory to package, e.g. ./build")
+    parser.add_argument("output", help="archive to create, e.g. pyqgis-docs-3.40.zip")
+    parser.add_argument(
+        "--previous",
+        dest="previous",
+        default=None,
+        help="previous release archive, compressed data of unchanged files is reused",
+    )
+    parser.add_argument("--level", "-l", dest="level", type=int, default=6)
+    parser.add_argument("--jobs", "-j", dest="jobs", type=int, default=None)
+    args = parser.parse_args()
+    make_archive(args.source_dir, args.output, args.previous, args.level, args.jobs)